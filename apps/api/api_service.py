@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 from datetime import date
+from functools import lru_cache, partial
 import os
 from pathlib import Path
 import re
 import shutil
-from typing import Any
+from typing import Any, Callable
 from uuid import uuid4
 
 from driver_log_renderer import generate_driver_log, list_dynamic_fields
@@ -13,7 +14,7 @@ from hos_compliance import HOSCycle, HOSRecapInput, apply_hos_compliance
 from persistence import (
     DriverProfileRecord,
     UserRecord,
-    create_daily_log,
+    create_daily_logs,
     create_trip_run,
 )
 from timeline_renderer import (
@@ -105,6 +106,8 @@ US_STATE_ABBREVIATIONS = {
     "wyoming": "WY",
 }
 
+US_STATE_CODES = frozenset(US_STATE_ABBREVIATIONS.values())
+
 ADDRESS_ABBREVIATIONS = (
     (r"\bstreet\b", "St"),
     (r"\broad\b", "Rd"),
@@ -124,13 +127,21 @@ ADDRESS_ABBREVIATIONS = (
     (r"\bwest\b", "W"),
 )
 
+_ADDRESS_ABBREVIATION_PATTERNS = tuple(
+    (re.compile(pattern, re.IGNORECASE), replacement) for pattern, replacement in ADDRESS_ABBREVIATIONS
+)
+_COUNTRY_SUFFIX = re.compile(r",?\s*(United States|United States of America|USA)\s*$", re.IGNORECASE)
+_FILENAME_UNSAFE = re.compile(r"[^a-z0-9]+")
+_WHITESPACE = re.compile(r"\s+")
+_ZIP_CODE = re.compile(r"\b\d{5}(?:-\d{4})?\b")
+
 
 class ServiceValidationError(ValueError):
     """Raised when request payload validation fails."""
 
 
 def _slugify_filename_part(value: str, *, fallback: str) -> str:
-    normalized = re.sub(r"[^a-z0-9]+", "-", value.strip().lower())
+    normalized = _FILENAME_UNSAFE.sub("-", value.strip().lower())
     normalized = normalized.strip("-")
     return normalized[:28] or fallback
 
@@ -150,7 +161,7 @@ def _build_log_export_basename(
 
 
 def _normalize_whitespace(value: str) -> str:
-    return re.sub(r"\s+", " ", str(value).strip())
+    return _WHITESPACE.sub(" ", str(value).strip())
 
 
 def _truncate_text(value: str, max_length: int) -> str:
@@ -164,14 +175,15 @@ def _truncate_text(value: str, max_length: int) -> str:
 
 def _maybe_state_abbreviation(value: str) -> str | None:
     normalized = _normalize_whitespace(value).lower()
-    normalized = re.sub(r"\b\d{5}(?:-\d{4})?\b", "", normalized).strip(" ,")
+    normalized = _ZIP_CODE.sub("", normalized).strip(" ,")
     if normalized in US_STATE_ABBREVIATIONS:
         return US_STATE_ABBREVIATIONS[normalized]
-    if normalized.upper() in set(US_STATE_ABBREVIATIONS.values()):
+    if normalized.upper() in US_STATE_CODES:
         return normalized.upper()
     return None
 
 
+@lru_cache(maxsize=256)
 def _compact_location_for_log(value: str, *, max_length: int) -> str:
     clean_value = _normalize_whitespace(value)
     if not clean_value or clean_value.upper() == "EN ROUTE":
@@ -204,33 +216,30 @@ def _compact_location_for_log(value: str, *, max_length: int) -> str:
     return _truncate_text(city_or_origin, max_length)
 
 
+@lru_cache(maxsize=256)
 def _compact_address_for_log(value: str, *, max_length: int) -> str:
     compacted = _normalize_whitespace(value)
-    compacted = re.sub(
-        r",?\s*(United States|United States of America|USA)\s*$",
-        "",
-        compacted,
-        flags=re.IGNORECASE,
-    )
-    for pattern, replacement in ADDRESS_ABBREVIATIONS:
-        compacted = re.sub(pattern, replacement, compacted, flags=re.IGNORECASE)
+    compacted = _COUNTRY_SUFFIX.sub("", compacted)
+    for pattern, replacement in _ADDRESS_ABBREVIATION_PATTERNS:
+        compacted = pattern.sub(replacement, compacted)
     return _truncate_text(compacted, max_length)
 
 
+FIELD_VALUE_RENDERERS: dict[str, Callable[[str], str]] = {
+    "from": partial(_compact_location_for_log, max_length=34),
+    "to": partial(_compact_location_for_log, max_length=34),
+    "main-office-address": partial(_compact_address_for_log, max_length=44),
+    "home-terminal-address": partial(_compact_address_for_log, max_length=44),
+    "shipper-commodity": partial(_truncate_text, max_length=42),
+    "dvl-or-manifest-number": partial(_truncate_text, max_length=24),
+    "name-of-carrier": partial(_truncate_text, max_length=34),
+    "truck-trailer-numbers": partial(_truncate_text, max_length=28),
+}
+
+
 def _render_field_value_for_template(field_id: str, value: str) -> str:
-    if field_id in {"from", "to"}:
-        return _compact_location_for_log(value, max_length=34)
-    if field_id in {"main-office-address", "home-terminal-address"}:
-        return _compact_address_for_log(value, max_length=44)
-    if field_id == "shipper-commodity":
-        return _truncate_text(value, 42)
-    if field_id == "dvl-or-manifest-number":
-        return _truncate_text(value, 24)
-    if field_id == "name-of-carrier":
-        return _truncate_text(value, 34)
-    if field_id == "truck-trailer-numbers":
-        return _truncate_text(value, 28)
-    return _normalize_whitespace(value)
+    renderer = FIELD_VALUE_RENDERERS.get(field_id, _normalize_whitespace)
+    return renderer(value)
 
 
 def _render_template_values(values: dict[str, str]) -> dict[str, str]:
@@ -460,11 +469,15 @@ def generate_trip_from_payload(
     scale = detect_template_scale(template_path)
 
     trip_input = parse_trip_payload(payload, profile.cycle_rule)
+    current_location = str(trip_input["current_location"])
+    pickup_location = str(trip_input["pickup_location"])
+    dropoff_location = str(trip_input["dropoff_location"])
+    current_cycle_used_hours = float(trip_input["current_cycle_used_hours"])
     plan = plan_trip(
-        current_location=str(trip_input["current_location"]),
-        pickup_location=str(trip_input["pickup_location"]),
-        dropoff_location=str(trip_input["dropoff_location"]),
-        current_cycle_used_hours=float(trip_input["current_cycle_used_hours"]),
+        current_location=current_location,
+        pickup_location=pickup_location,
+        dropoff_location=dropoff_location,
+        current_cycle_used_hours=current_cycle_used_hours,
         cycle=str(trip_input["cycle"]),
         start_date=trip_input["start_date"],  # type: ignore[arg-type]
     )
@@ -480,10 +493,10 @@ def generate_trip_from_payload(
             driver_user_id=current_user.id,
             created_by_user_id=current_user.id,
             cycle=profile.cycle_rule,
-            current_location=str(trip_input["current_location"]),
-            pickup_location=str(trip_input["pickup_location"]),
-            dropoff_location=str(trip_input["dropoff_location"]),
-            current_cycle_used_hours=float(trip_input["current_cycle_used_hours"]),
+            current_location=current_location,
+            pickup_location=pickup_location,
+            dropoff_location=dropoff_location,
+            current_cycle_used_hours=current_cycle_used_hours,
             start_date=trip_start,
             end_date=trip_end,
             plan=plan_dict,
@@ -495,30 +508,38 @@ def generate_trip_from_payload(
         if key in base_values:
             base_values[key] = str(value)
 
-    previous_on_duty_history = [float(trip_input["current_cycle_used_hours"]), 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
+    previous_on_duty_history = [current_cycle_used_hours, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
     generated_logs: list[dict[str, object]] = []
+    pending_logs: list[dict[str, Any]] = []
     latest_pdf_path: Path | None = None
     restart_streak_hours = 0.0
     total_days = len(plan.daily_logs)
     cumulative_miles = 0.0
+    current_label = str(plan.locations["current"]["label"])
+    pickup_label = str(plan.locations["pickup"]["label"])
+    dropoff_label = str(plan.locations["dropoff"]["label"])
+    commodity_value = (
+        f"{_compact_location_for_log(pickup_label, max_length=18)} -> "
+        f"{_compact_location_for_log(dropoff_label, max_length=18)}"
+    )
 
     for index, day in enumerate(plan.daily_logs):
         day_values = dict(base_values)
         cumulative_miles += day.miles_driven
 
         day_date = date.fromisoformat(day.log_date)
-        from_value = plan.locations["current"]["label"] if index == 0 else "EN ROUTE"
+        from_value = current_label if index == 0 else "EN ROUTE"
         if index == total_days - 1:
-            to_value = plan.locations["dropoff"]["label"]
+            to_value = dropoff_label
         elif index == 0:
-            to_value = plan.locations["pickup"]["label"]
+            to_value = pickup_label
         else:
             to_value = "EN ROUTE"
 
         if "from" in day_values:
-            day_values["from"] = _render_field_value_for_template("from", str(from_value))
+            day_values["from"] = _render_field_value_for_template("from", from_value)
         if "to" in day_values:
-            day_values["to"] = _render_field_value_for_template("to", str(to_value))
+            day_values["to"] = _render_field_value_for_template("to", to_value)
         if "off-duty-hours" in day_values:
             day_values["off-duty-hours"] = format_hours_value(day.off_duty_hours)
         if "sleeper-berth-hours" in day_values:
@@ -538,10 +559,6 @@ def generate_trip_from_payload(
         if "log-date-day" in day_values:
             day_values["log-date-day"] = f"{day_date.day:02d}"
         if "shipper-commodity" in day_values and not str(day_values["shipper-commodity"]).strip():
-            commodity_value = (
-                f"{_compact_location_for_log(plan.locations['pickup']['label'], max_length=18)} -> "
-                f"{_compact_location_for_log(plan.locations['dropoff']['label'], max_length=18)}"
-            )
             day_values["shipper-commodity"] = _render_field_value_for_template(
                 "shipper-commodity",
                 commodity_value,
@@ -581,8 +598,8 @@ def generate_trip_from_payload(
             log_date=day.log_date,
             day_index=index + 1,
             total_days=total_days,
-            from_value=str(from_value),
-            to_value=str(to_value),
+            from_value=from_value,
+            to_value=to_value,
             suffix=artifact_suffix,
         )
         output_svg_path = REPORTS_DIR / f"{artifact_basename}.svg"
@@ -593,33 +610,37 @@ def generate_trip_from_payload(
             output_pdf_path=output_pdf_path,
             values=day_values,
             timeline_svg=timeline_svg,
+            template_fields=template_fields,
         )
 
         latest_pdf_path = output_pdf_path
 
-        record = None
+        record_id = None
         if save_record:
-            record = create_daily_log(
-                db_path=DB_PATH,
-                organization_id=current_user.organization_id,
-                driver_user_id=current_user.id,
-                created_by_user_id=current_user.id,
-                trip_run_id=trip_run_id,
-                log_date=day.log_date,
-                cycle=profile.cycle_rule,
-                values=day_values,
-                recap={
+            record_id = uuid4().hex
+            pending_logs.append(
+                {
+                    "id": record_id,
+                    "organization_id": current_user.organization_id,
+                    "driver_user_id": current_user.id,
+                    "created_by_user_id": current_user.id,
+                    "trip_run_id": trip_run_id,
+                    "log_date": day.log_date,
                     "cycle": profile.cycle_rule,
-                    "current_cycle_used_hours": trip_input["current_cycle_used_hours"],
-                    "previous_on_duty_hours": previous_on_duty_history[:7],
-                },
-                compliance=compliance_dict,
-                timeline_events=day.timeline_events,
-                svg_path=str(output_svg_path),
-                pdf_path=str(output_pdf_path),
+                    "values": day_values,
+                    "recap": {
+                        "cycle": profile.cycle_rule,
+                        "current_cycle_used_hours": current_cycle_used_hours,
+                        "previous_on_duty_hours": previous_on_duty_history[:7],
+                    },
+                    "compliance": compliance_dict,
+                    "timeline_events": day.timeline_events,
+                    "svg_path": str(output_svg_path),
+                    "pdf_path": str(output_pdf_path),
+                }
             )
 
-        pdf_url = f"/api/logs/{record['id']}/pdf/{output_pdf_path.name}" if record else str(output_pdf_path)
+        pdf_url = f"/api/logs/{record_id}/pdf/{output_pdf_path.name}" if record_id else str(output_pdf_path)
         generated_logs.append(
             {
                 "index": index + 1,
@@ -632,7 +653,7 @@ def generate_trip_from_payload(
                 "is_legal_tomorrow": compliance_dict["is_legal_tomorrow"],
                 "available_hours_tomorrow": compliance_dict["available_hours_tomorrow"],
                 "violations": compliance_dict["violations"],
-                "record_id": record["id"] if record else None,
+                "record_id": record_id,
                 "trip_run_id": trip_run_id,
                 "pdf_url": pdf_url,
                 "pdf_filename": output_pdf_path.name,
@@ -646,6 +667,9 @@ def generate_trip_from_payload(
 
         previous_on_duty_history = [float(compliance_dict["today_on_duty_hours"]), *previous_on_duty_history[:6]]
 
+    if pending_logs:
+        create_daily_logs(DB_PATH, pending_logs)
+
     if latest_pdf_path:
         shutil.copyfile(latest_pdf_path, PDF_PATH)
 
@@ -19,11 +19,12 @@ from api_service import (
 )
 from driver_log_renderer import list_dynamic_fields
 from persistence import (
+    create_driver_account,
     create_session,
-    create_user_with_organization,
     delete_session,
-    get_daily_log,
+    get_daily_log_files,
     get_driver_profile,
+    get_user_and_profile_by_session_token,
     get_user_by_email,
     get_user_by_session_token,
     hash_password,
@@ -74,8 +75,7 @@ def get_current_user(request: HttpRequest):
     return get_user_by_session_token(DB_PATH, token)
 
 
-def require_authenticated_user(request: HttpRequest):
-    user = get_current_user(request)
+def ensure_driver_user(user):
     if user is None:
         raise PermissionError("Authentication required.")
     if user.role != "driver":
@@ -83,9 +83,20 @@ def require_authenticated_user(request: HttpRequest):
     return user
 
 
-def build_auth_response(user, *, status: int = 200) -> JsonResponse:
+def require_authenticated_user(request: HttpRequest):
+    return ensure_driver_user(get_current_user(request))
+
+
+def require_authenticated_user_with_profile(request: HttpRequest):
+    token = get_session_token(request)
+    if not token:
+        raise PermissionError("Authentication required.")
+    user, profile = get_user_and_profile_by_session_token(DB_PATH, token)
+    return ensure_driver_user(user), profile
+
+
+def build_auth_response(user, profile, *, status: int = 200) -> JsonResponse:
     session = create_session(DB_PATH, user.id)
-    profile = get_driver_profile(DB_PATH, user.id)
     response = JsonResponse(
         {
             "user": serialize_user(user),
@@ -130,26 +141,14 @@ def auth_signup(request: HttpRequest) -> JsonResponse:
             raise ServiceValidationError("Password must be at least 8 characters.")
 
         workspace_name = f"{full_name.split()[0]}'s Driver Workspace"
-        user = create_user_with_organization(
+        user, profile = create_driver_account(
             db_path=DB_PATH,
             organization_name=workspace_name,
             full_name=full_name,
             email=email,
-            role="driver",
             password_hash_value=hash_password(password),
         )
-        upsert_driver_profile(
-            db_path=DB_PATH,
-            organization_id=user.organization_id,
-            user_id=user.id,
-            carrier_name="",
-            main_office_address="",
-            home_terminal_address="",
-            truck_trailer_numbers="",
-            cycle_rule="70",
-            is_onboarding_complete=False,
-        )
-        return build_auth_response(user, status=201)
+        return build_auth_response(user, profile, status=201)
     except ServiceValidationError as exc:
         return json_error(str(exc), 422)
     except Exception as exc:
@@ -175,7 +174,7 @@ def auth_login(request: HttpRequest) -> JsonResponse:
         if user is None or not password_hash_value or not verify_password(password, password_hash_value):
             return json_error("Invalid email or password.", 401)
 
-        return build_auth_response(user)
+        return build_auth_response(user, get_driver_profile(DB_PATH, user.id))
     except ServiceValidationError as exc:
         return json_error(str(exc), 422)
 
@@ -199,8 +198,7 @@ def auth_me(request: HttpRequest) -> JsonResponse:
         return HttpResponseNotAllowed(["GET"])
 
     try:
-        user = require_authenticated_user(request)
-        profile = get_driver_profile(DB_PATH, user.id)
+        user, profile = require_authenticated_user_with_profile(request)
         return JsonResponse(
             {
                 "user": serialize_user(user),
@@ -215,18 +213,17 @@ def auth_me(request: HttpRequest) -> JsonResponse:
 @csrf_exempt
 def profile_detail(request: HttpRequest) -> JsonResponse:
     try:
-        user = require_authenticated_user(request)
+        user, current_profile = require_authenticated_user_with_profile(request)
     except PermissionError as exc:
         return json_error(str(exc), 401)
 
     if request.method == "GET":
-        return JsonResponse({"profile": serialize_driver_profile(get_driver_profile(DB_PATH, user.id))})
+        return JsonResponse({"profile": serialize_driver_profile(current_profile)})
 
     if request.method != "PUT":
         return HttpResponseNotAllowed(["GET", "PUT"])
 
     try:
-        current_profile = get_driver_profile(DB_PATH, user.id)
         if current_profile is not None and current_profile.is_onboarding_complete:
             return json_error(
                 "Onboarding is locked once submitted for this assessment flow.",
@@ -294,8 +291,7 @@ def trips_plan(request: HttpRequest) -> JsonResponse:
         return HttpResponseNotAllowed(["POST"])
 
     try:
-        user = require_authenticated_user(request)
-        profile = get_driver_profile(DB_PATH, user.id)
+        _, profile = require_authenticated_user_with_profile(request)
         if profile is None or not profile.is_onboarding_complete:
             return json_error("Complete onboarding before planning a trip.", 409)
 
@@ -314,8 +310,7 @@ def trips_generate(request: HttpRequest) -> JsonResponse:
         return HttpResponseNotAllowed(["POST"])
 
     try:
-        user = require_authenticated_user(request)
-        profile = get_driver_profile(DB_PATH, user.id)
+        user, profile = require_authenticated_user_with_profile(request)
         if profile is None:
             return json_error("Driver profile not found.", 404)
 
@@ -341,7 +336,7 @@ def _log_file_response(request: HttpRequest, record_id: str, suffix: str, conten
     except PermissionError as exc:
         return json_error(str(exc), 401)
 
-    record = get_daily_log(DB_PATH, record_id)
+    record = get_daily_log_files(DB_PATH, record_id)
     if record is None:
         return json_error("Log record not found.", 404)
     if record["organization_id"] != user.organization_id or record["driver_user_id"] != user.id:
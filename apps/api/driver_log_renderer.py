@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+from functools import lru_cache
 import re
 import subprocess
 import xml.etree.ElementTree as ET
 from pathlib import Path
+from typing import Any
 from xml.sax.saxutils import escape
 
 try:
@@ -13,6 +15,7 @@ except ImportError:
 
 SVG_NS = "http://www.w3.org/2000/svg"
 NS = {"svg": SVG_NS}
+_LABEL_SEPARATORS = str.maketrans("-_", "  ")
 
 
 class DriverLogRendererError(RuntimeError):
@@ -33,6 +36,18 @@ _TSPAN_BLOCK = re.compile(
 )
 
 
+def _template_mtime_ns(template_path: Path) -> int:
+    try:
+        return template_path.stat().st_mtime_ns
+    except FileNotFoundError as exc:
+        raise DriverLogRendererError(f"Template not found: {template_path}") from exc
+
+
+@lru_cache(maxsize=8)
+def _read_template_text(template_path: Path, mtime_ns: int) -> str:
+    return template_path.read_text(encoding="utf-8")
+
+
 def read_template_tree(template_path: Path) -> ET.ElementTree:
     if not template_path.exists():
         raise DriverLogRendererError(f"Template not found: {template_path}")
@@ -55,6 +70,12 @@ def current_text_value(text_node: ET.Element) -> str:
 
 
 def list_dynamic_fields(template_path: Path) -> list[dict[str, str]]:
+    cached_fields = _list_dynamic_fields(template_path, _template_mtime_ns(template_path))
+    return [dict(field) for field in cached_fields]
+
+
+@lru_cache(maxsize=8)
+def _list_dynamic_fields(template_path: Path, mtime_ns: int) -> tuple[dict[str, str], ...]:
     tree = read_template_tree(template_path)
     fields: list[dict[str, str]] = []
 
@@ -65,12 +86,12 @@ def list_dynamic_fields(template_path: Path) -> list[dict[str, str]]:
         fields.append(
             {
                 "id": text_id,
-                "label": text_id.replace("-", " ").replace("_", " ").title(),
+                "label": text_id.translate(_LABEL_SEPARATORS).title(),
                 "value": current_text_value(text_node),
             }
         )
 
-    return fields
+    return tuple(fields)
 
 
 def write_filled_svg(
@@ -79,10 +100,7 @@ def write_filled_svg(
     values: dict[str, str],
     timeline_svg: str | None = None,
 ) -> None:
-    if not template_path.exists():
-        raise DriverLogRendererError(f"Template not found: {template_path}")
-
-    template_svg = template_path.read_text(encoding="utf-8")
+    template_svg = _read_template_text(template_path, _template_mtime_ns(template_path))
     dynamic_layer = _DYNAMIC_LAYER_BODY.search(template_svg)
     if dynamic_layer is None:
         raise DriverLogRendererError("Could not find <g id='dynamic'> in the template.")
@@ -128,18 +146,35 @@ def write_filled_svg(
     output_svg_path.write_text(filled_svg, encoding="utf-8")
 
 
+_CAIROSVG: Any = None
+_CAIROSVG_IMPORT_ERROR: Exception | None = None
+
+
+def _load_cairosvg() -> Any:
+    global _CAIROSVG, _CAIROSVG_IMPORT_ERROR
+
+    if _CAIROSVG is None and _CAIROSVG_IMPORT_ERROR is None:
+        try:
+            import cairosvg  # Imported lazily so rsvg fallback still works.
+        except Exception as exc:  # pragma: no cover - depends on system libs.
+            _CAIROSVG_IMPORT_ERROR = exc
+        else:
+            _CAIROSVG = cairosvg
+    return _CAIROSVG
+
+
 def convert_svg_to_pdf(output_svg_path: Path, output_pdf_path: Path) -> None:
     cairo_error: Exception | None = None
 
-    try:
-        import cairosvg  # Imported lazily so rsvg fallback still works.
-
-        cairosvg.svg2pdf(url=str(output_svg_path), write_to=str(output_pdf_path))
-        return
-    except ImportError as exc:
-        cairo_error = exc
-    except Exception as exc:  # pragma: no cover - depends on system libs/fonts.
-        cairo_error = exc
+    cairosvg = _load_cairosvg()
+    if cairosvg is None:
+        cairo_error = _CAIROSVG_IMPORT_ERROR
+    else:
+        try:
+            cairosvg.svg2pdf(url=str(output_svg_path), write_to=str(output_pdf_path))
+            return
+        except Exception as exc:  # pragma: no cover - depends on system libs/fonts.
+            cairo_error = exc
 
     try:
         subprocess.run(
@@ -173,8 +208,9 @@ def generate_driver_log(
     output_pdf_path: Path,
     values: dict[str, str],
     timeline_svg: str | None = None,
+    template_fields: list[dict[str, str]] | None = None,
 ) -> None:
-    fields = list_dynamic_fields(template_path)
+    fields = template_fields if template_fields is not None else list_dynamic_fields(template_path)
     allowed_values = {field["id"]: field["value"] for field in fields}
 
     for key, value in values.items():
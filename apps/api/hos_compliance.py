@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from enum import Enum
 from typing import Iterable, Mapping, Sequence
 
@@ -33,7 +33,20 @@ class HOSComputationResult:
     violations: list[str]
 
     def to_dict(self) -> dict[str, object]:
-        return asdict(self)
+        return {
+            "computed_values": dict(self.computed_values),
+            "field_ids": dict(self.field_ids),
+            "cycle": self.cycle,
+            "cycle_cap_hours": self.cycle_cap_hours,
+            "recap_a_hours": self.recap_a_hours,
+            "recap_c_hours": self.recap_c_hours,
+            "available_hours_tomorrow": self.available_hours_tomorrow,
+            "today_on_duty_hours": self.today_on_duty_hours,
+            "restart_applied": self.restart_applied,
+            "is_legal_today": self.is_legal_today,
+            "is_legal_tomorrow": self.is_legal_tomorrow,
+            "violations": list(self.violations),
+        }
 
 
 def _pick_field_id(
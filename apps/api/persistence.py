@@ -15,6 +15,7 @@ from uuid import uuid4
 
 
 VALID_ROLES = {"admin", "dispatcher", "driver"}
+DEFAULT_CYCLE_RULE = "70"
 PBKDF2_ITERATIONS = int(os.getenv("AUTH_PBKDF2_ITERATIONS", "390000"))
 SESSION_TTL_HOURS = int(os.getenv("AUTH_SESSION_TTL_HOURS", "24"))
 
@@ -92,7 +93,8 @@ def hash_session_token(token: str) -> str:
 
 @contextmanager
 def connect(db_path: Path) -> Iterator[sqlite3.Connection]:
-    db_path.parent.mkdir(parents=True, exist_ok=True)
+    if not db_path.exists():
+        db_path.parent.mkdir(parents=True, exist_ok=True)
     connection = sqlite3.connect(str(db_path))
     connection.row_factory = sqlite3.Row
     try:
@@ -194,6 +196,8 @@ def init_db(db_path: Path) -> None:
 
             CREATE INDEX IF NOT EXISTS idx_users_org_role
                 ON users (organization_id, role);
+            CREATE INDEX IF NOT EXISTS idx_sessions_expires
+                ON sessions (expires_at);
             CREATE INDEX IF NOT EXISTS idx_driver_profiles_org_user
                 ON driver_profiles (organization_id, user_id);
             CREATE INDEX IF NOT EXISTS idx_trip_runs_org_created
@@ -226,20 +230,20 @@ def row_to_user(row: sqlite3.Row | None) -> UserRecord | None:
     )
 
 
-def row_to_driver_profile(row: sqlite3.Row | None) -> DriverProfileRecord | None:
-    if row is None:
+def row_to_driver_profile(row: sqlite3.Row | None, *, prefix: str = "") -> DriverProfileRecord | None:
+    if row is None or row[f"{prefix}user_id"] is None:
         return None
     return DriverProfileRecord(
-        user_id=str(row["user_id"]),
-        organization_id=str(row["organization_id"]),
-        carrier_name=str(row["carrier_name"]),
-        main_office_address=str(row["main_office_address"]),
-        home_terminal_address=str(row["home_terminal_address"]),
-        truck_trailer_numbers=str(row["truck_trailer_numbers"]),
-        cycle_rule=str(row["cycle_rule"]),
-        is_onboarding_complete=bool(row["is_onboarding_complete"]),
-        created_at=str(row["created_at"]),
-        updated_at=str(row["updated_at"]),
+        user_id=str(row[f"{prefix}user_id"]),
+        organization_id=str(row[f"{prefix}organization_id"]),
+        carrier_name=str(row[f"{prefix}carrier_name"]),
+        main_office_address=str(row[f"{prefix}main_office_address"]),
+        home_terminal_address=str(row[f"{prefix}home_terminal_address"]),
+        truck_trailer_numbers=str(row[f"{prefix}truck_trailer_numbers"]),
+        cycle_rule=str(row[f"{prefix}cycle_rule"]),
+        is_onboarding_complete=bool(row[f"{prefix}is_onboarding_complete"]),
+        created_at=str(row[f"{prefix}created_at"]),
+        updated_at=str(row[f"{prefix}updated_at"]),
     )
 
 
@@ -279,6 +283,133 @@ def get_user_by_id(db_path: Path, user_id: str) -> UserRecord | None:
     return row_to_user(row)
 
 
+def _normalize_role(role: str) -> str:
+    normalized_role = role.strip().lower()
+    if normalized_role not in VALID_ROLES:
+        raise ValueError("Invalid role.")
+    return normalized_role
+
+
+def _insert_organization(conn: sqlite3.Connection, name: str, timestamp: str) -> str:
+    organization_id = uuid4().hex
+    conn.execute(
+        """
+        INSERT INTO organizations (id, name, created_at)
+        VALUES (?, ?, ?)
+        """,
+        (organization_id, name.strip(), timestamp),
+    )
+    return organization_id
+
+
+def _insert_user(
+    conn: sqlite3.Connection,
+    *,
+    organization_id: str,
+    full_name: str,
+    email: str,
+    role: str,
+    password_hash_value: str,
+    timestamp: str,
+) -> UserRecord:
+    user_id = uuid4().hex
+    normalized_email = normalize_email(email)
+    normalized_full_name = full_name.strip()
+    conn.execute(
+        """
+        INSERT INTO users (id, organization_id, email, full_name, role, password_hash, is_active, created_at)
+        VALUES (?, ?, ?, ?, ?, ?, 1, ?)
+        """,
+        (
+            user_id,
+            organization_id,
+            normalized_email,
+            normalized_full_name,
+            role,
+            password_hash_value,
+            timestamp,
+        ),
+    )
+    return UserRecord(
+        id=user_id,
+        organization_id=organization_id,
+        email=normalized_email,
+        full_name=normalized_full_name,
+        role=role,
+        is_active=True,
+        created_at=timestamp,
+    )
+
+
+def _upsert_driver_profile(
+    conn: sqlite3.Connection,
+    *,
+    organization_id: str,
+    user_id: str,
+    carrier_name: str,
+    main_office_address: str,
+    home_terminal_address: str,
+    truck_trailer_numbers: str,
+    cycle_rule: str,
+    is_onboarding_complete: bool,
+    timestamp: str,
+) -> DriverProfileRecord:
+    row = conn.execute(
+        """
+        INSERT INTO driver_profiles (
+            user_id,
+            organization_id,
+            carrier_name,
+            main_office_address,
+            home_terminal_address,
+            truck_trailer_numbers,
+            cycle_rule,
+            is_onboarding_complete,
+            created_at,
+            updated_at
+        )
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(user_id) DO UPDATE SET
+            organization_id = excluded.organization_id,
+            carrier_name = excluded.carrier_name,
+            main_office_address = excluded.main_office_address,
+            home_terminal_address = excluded.home_terminal_address,
+            truck_trailer_numbers = excluded.truck_trailer_numbers,
+            cycle_rule = excluded.cycle_rule,
+            is_onboarding_complete = excluded.is_onboarding_complete,
+            updated_at = excluded.updated_at
+        RETURNING
+            user_id,
+            organization_id,
+            carrier_name,
+            main_office_address,
+            home_terminal_address,
+            truck_trailer_numbers,
+            cycle_rule,
+            is_onboarding_complete,
+            created_at,
+            updated_at
+        """,
+        (
+            user_id,
+            organization_id,
+            carrier_name.strip(),
+            main_office_address.strip(),
+            home_terminal_address.strip(),
+            truck_trailer_numbers.strip(),
+            cycle_rule,
+            1 if is_onboarding_complete else 0,
+            timestamp,
+            timestamp,
+        ),
+    ).fetchone()
+
+    profile = row_to_driver_profile(row)
+    if profile is None:
+        raise RuntimeError("Failed to create driver profile.")
+    return profile
+
+
 def create_bootstrap_admin(
     db_path: Path,
     organization_name: str,
@@ -289,37 +420,21 @@ def create_bootstrap_admin(
     if users_exist(db_path):
         raise ValueError("Bootstrap already completed; users already exist.")
 
-    organization_id = uuid4().hex
-    user_id = uuid4().hex
     timestamp = utc_now_iso()
 
     with connect(db_path) as conn:
-        conn.execute(
-            """
-            INSERT INTO organizations (id, name, created_at)
-            VALUES (?, ?, ?)
-            """,
-            (organization_id, organization_name.strip(), timestamp),
-        )
-        conn.execute(
-            """
-            INSERT INTO users (id, organization_id, email, full_name, role, password_hash, is_active, created_at)
-            VALUES (?, ?, ?, ?, 'admin', ?, 1, ?)
-            """,
-            (
-                user_id,
-                organization_id,
-                normalize_email(email),
-                full_name.strip(),
-                password_hash_value,
-                timestamp,
-            ),
+        organization_id = _insert_organization(conn, organization_name, timestamp)
+        user = _insert_user(
+            conn,
+            organization_id=organization_id,
+            full_name=full_name,
+            email=email,
+            role="admin",
+            password_hash_value=password_hash_value,
+            timestamp=timestamp,
         )
         conn.commit()
 
-    user = get_user_by_id(db_path, user_id)
-    if user is None:
-        raise RuntimeError("Failed to create bootstrap user.")
     return user
 
 
@@ -331,43 +446,60 @@ def create_user_with_organization(
     role: str,
     password_hash_value: str,
 ) -> UserRecord:
-    normalized_role = role.strip().lower()
-    if normalized_role not in VALID_ROLES:
-        raise ValueError("Invalid role.")
+    normalized_role = _normalize_role(role)
+    timestamp = utc_now_iso()
 
-    organization_id = uuid4().hex
-    user_id = uuid4().hex
+    with connect(db_path) as conn:
+        organization_id = _insert_organization(conn, organization_name, timestamp)
+        user = _insert_user(
+            conn,
+            organization_id=organization_id,
+            full_name=full_name,
+            email=email,
+            role=normalized_role,
+            password_hash_value=password_hash_value,
+            timestamp=timestamp,
+        )
+        conn.commit()
+
+    return user
+
+
+def create_driver_account(
+    db_path: Path,
+    organization_name: str,
+    full_name: str,
+    email: str,
+    password_hash_value: str,
+) -> tuple[UserRecord, DriverProfileRecord]:
     timestamp = utc_now_iso()
 
     with connect(db_path) as conn:
-        conn.execute(
-            """
-            INSERT INTO organizations (id, name, created_at)
-            VALUES (?, ?, ?)
-            """,
-            (organization_id, organization_name.strip(), timestamp),
+        organization_id = _insert_organization(conn, organization_name, timestamp)
+        user = _insert_user(
+            conn,
+            organization_id=organization_id,
+            full_name=full_name,
+            email=email,
+            role="driver",
+            password_hash_value=password_hash_value,
+            timestamp=timestamp,
         )
-        conn.execute(
-            """
-            INSERT INTO users (id, organization_id, email, full_name, role, password_hash, is_active, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, 1, ?)
-            """,
-            (
-                user_id,
-                organization_id,
-                normalize_email(email),
-                full_name.strip(),
-                normalized_role,
-                password_hash_value,
-                timestamp,
-            ),
+        profile = _upsert_driver_profile(
+            conn,
+            organization_id=organization_id,
+            user_id=user.id,
+            carrier_name="",
+            main_office_address="",
+            home_terminal_address="",
+            truck_trailer_numbers="",
+            cycle_rule=DEFAULT_CYCLE_RULE,
+            is_onboarding_complete=False,
+            timestamp=timestamp,
         )
         conn.commit()
 
-    user = get_user_by_id(db_path, user_id)
-    if user is None:
-        raise RuntimeError("Failed to create standalone user.")
-    return user
+    return user, profile
 
 
 def create_user(
@@ -378,34 +510,21 @@ def create_user(
     role: str,
     password_hash_value: str,
 ) -> UserRecord:
-    normalized_role = role.strip().lower()
-    if normalized_role not in VALID_ROLES:
-        raise ValueError("Invalid role.")
-
-    user_id = uuid4().hex
+    normalized_role = _normalize_role(role)
     timestamp = utc_now_iso()
 
     with connect(db_path) as conn:
-        conn.execute(
-            """
-            INSERT INTO users (id, organization_id, email, full_name, role, password_hash, is_active, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, 1, ?)
-            """,
-            (
-                user_id,
-                organization_id,
-                normalize_email(email),
-                full_name.strip(),
-                normalized_role,
-                password_hash_value,
-                timestamp,
-            ),
+        user = _insert_user(
+            conn,
+            organization_id=organization_id,
+            full_name=full_name,
+            email=email,
+            role=normalized_role,
+            password_hash_value=password_hash_value,
+            timestamp=timestamp,
         )
         conn.commit()
 
-    user = get_user_by_id(db_path, user_id)
-    if user is None:
-        raise RuntimeError("Failed to create user.")
     return user
 
 
@@ -441,65 +560,28 @@ def upsert_driver_profile(
     main_office_address: str,
     home_terminal_address: str,
     truck_trailer_numbers: str,
-    cycle_rule: str = "70",
+    cycle_rule: str = DEFAULT_CYCLE_RULE,
     is_onboarding_complete: bool = True,
 ) -> DriverProfileRecord:
     normalized_cycle_rule = str(cycle_rule).strip()
     if normalized_cycle_rule not in {"60", "70"}:
         raise ValueError("cycle_rule must be either '60' or '70'.")
 
-    timestamp = utc_now_iso()
-
     with connect(db_path) as conn:
-        existing = conn.execute(
-            "SELECT created_at FROM driver_profiles WHERE user_id = ?",
-            (user_id,),
-        ).fetchone()
-
-        created_at = str(existing["created_at"]) if existing is not None else timestamp
-        conn.execute(
-            """
-            INSERT INTO driver_profiles (
-                user_id,
-                organization_id,
-                carrier_name,
-                main_office_address,
-                home_terminal_address,
-                truck_trailer_numbers,
-                cycle_rule,
-                is_onboarding_complete,
-                created_at,
-                updated_at
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(user_id) DO UPDATE SET
-                organization_id = excluded.organization_id,
-                carrier_name = excluded.carrier_name,
-                main_office_address = excluded.main_office_address,
-                home_terminal_address = excluded.home_terminal_address,
-                truck_trailer_numbers = excluded.truck_trailer_numbers,
-                cycle_rule = excluded.cycle_rule,
-                is_onboarding_complete = excluded.is_onboarding_complete,
-                updated_at = excluded.updated_at
-            """,
-            (
-                user_id,
-                organization_id,
-                carrier_name.strip(),
-                main_office_address.strip(),
-                home_terminal_address.strip(),
-                truck_trailer_numbers.strip(),
-                normalized_cycle_rule,
-                1 if is_onboarding_complete else 0,
-                created_at,
-                timestamp,
-            ),
+        profile = _upsert_driver_profile(
+            conn,
+            organization_id=organization_id,
+            user_id=user_id,
+            carrier_name=carrier_name,
+            main_office_address=main_office_address,
+            home_terminal_address=home_terminal_address,
+            truck_trailer_numbers=truck_trailer_numbers,
+            cycle_rule=normalized_cycle_rule,
+            is_onboarding_complete=is_onboarding_complete,
+            timestamp=utc_now_iso(),
         )
         conn.commit()
 
-    profile = get_driver_profile(db_path, user_id)
-    if profile is None:
-        raise RuntimeError("Failed to create driver profile.")
     return profile
 
 
@@ -522,9 +604,11 @@ def list_users(
     query += " ORDER BY created_at DESC"
 
     with connect(db_path) as conn:
-        rows = conn.execute(query, tuple(params)).fetchall()
+        return [user for row in conn.execute(query, tuple(params)) if (user := row_to_user(row)) is not None]
 
-    return [user for row in rows if (user := row_to_user(row)) is not None]
+
+def _prune_expired_sessions(conn: sqlite3.Connection, now: str) -> None:
+    conn.execute("DELETE FROM sessions WHERE expires_at <= ?", (now,))
 
 
 def create_session(db_path: Path, user_id: str) -> SessionRecord:
@@ -534,6 +618,7 @@ def create_session(db_path: Path, user_id: str) -> SessionRecord:
     expires_at = created_at + timedelta(hours=SESSION_TTL_HOURS)
 
     with connect(db_path) as conn:
+        _prune_expired_sessions(conn, created_at.isoformat())
         conn.execute(
             """
             INSERT INTO sessions (token_hash, user_id, expires_at, created_at)
@@ -564,14 +649,13 @@ def delete_session(db_path: Path, token: str) -> None:
 
 
 def prune_expired_sessions(db_path: Path) -> None:
-    now = utc_now_iso()
     with connect(db_path) as conn:
-        conn.execute("DELETE FROM sessions WHERE expires_at <= ?", (now,))
+        _prune_expired_sessions(conn, utc_now_iso())
         conn.commit()
 
 
 def get_user_by_session_token(db_path: Path, token: str) -> UserRecord | None:
-    prune_expired_sessions(db_path)
+    now = utc_now_iso()
     with connect(db_path) as conn:
         row = conn.execute(
             """
@@ -582,13 +666,53 @@ def get_user_by_session_token(db_path: Path, token: str) -> UserRecord | None:
             """,
             (
                 hash_session_token(token),
-                utc_now_iso(),
+                now,
             ),
         ).fetchone()
 
     return row_to_user(row)
 
 
+def get_user_and_profile_by_session_token(
+    db_path: Path,
+    token: str,
+) -> tuple[UserRecord | None, DriverProfileRecord | None]:
+    now = utc_now_iso()
+    with connect(db_path) as conn:
+        row = conn.execute(
+            """
+            SELECT
+                u.id,
+                u.organization_id,
+                u.email,
+                u.full_name,
+                u.role,
+                u.is_active,
+                u.created_at,
+                p.user_id AS profile_user_id,
+                p.organization_id AS profile_organization_id,
+                p.carrier_name AS profile_carrier_name,
+                p.main_office_address AS profile_main_office_address,
+                p.home_terminal_address AS profile_home_terminal_address,
+                p.truck_trailer_numbers AS profile_truck_trailer_numbers,
+                p.cycle_rule AS profile_cycle_rule,
+                p.is_onboarding_complete AS profile_is_onboarding_complete,
+                p.created_at AS profile_created_at,
+                p.updated_at AS profile_updated_at
+            FROM sessions s
+            JOIN users u ON u.id = s.user_id
+            LEFT JOIN driver_profiles p ON p.user_id = u.id
+            WHERE s.token_hash = ? AND s.expires_at > ? AND u.is_active = 1
+            """,
+            (
+                hash_session_token(token),
+                now,
+            ),
+        ).fetchone()
+
+    return row_to_user(row), row_to_driver_profile(row, prefix="profile_")
+
+
 def create_trip_run(
     db_path: Path,
     organization_id: str,
@@ -745,9 +869,7 @@ def list_trip_runs(
     params.append(max(1, min(limit, 100)))
 
     with connect(db_path) as conn:
-        rows = conn.execute(query, tuple(params)).fetchall()
-
-    return [_parse_trip_run_row(row) for row in rows]
+        return [_parse_trip_run_row(row) for row in conn.execute(query, tuple(params))]
 
 
 def get_trip_run(db_path: Path, record_id: str) -> dict[str, Any] | None:
@@ -799,11 +921,72 @@ def create_daily_log(
     svg_path: str,
     pdf_path: str,
 ) -> dict[str, Any]:
-    record_id = uuid4().hex
+    return create_daily_logs(
+        db_path,
+        [
+            {
+                "organization_id": organization_id,
+                "driver_user_id": driver_user_id,
+                "created_by_user_id": created_by_user_id,
+                "trip_run_id": trip_run_id,
+                "log_date": log_date,
+                "cycle": cycle,
+                "values": values,
+                "recap": recap,
+                "compliance": compliance,
+                "timeline_events": timeline_events,
+                "svg_path": svg_path,
+                "pdf_path": pdf_path,
+            }
+        ],
+    )[0]
+
+
+def create_daily_logs(db_path: Path, logs: Sequence[dict[str, Any]]) -> list[dict[str, Any]]:
     created_at = utc_now_iso()
+    records: list[dict[str, Any]] = []
+    rows: list[tuple[Any, ...]] = []
+
+    for log in logs:
+        record_id = str(log.get("id") or uuid4().hex)
+        records.append(
+            {
+                "id": record_id,
+                "organization_id": log["organization_id"],
+                "driver_user_id": log["driver_user_id"],
+                "created_by_user_id": log["created_by_user_id"],
+                "trip_run_id": log["trip_run_id"],
+                "log_date": log["log_date"],
+                "cycle": log["cycle"],
+                "svg_path": log["svg_path"],
+                "pdf_path": log["pdf_path"],
+                "created_at": created_at,
+            }
+        )
+        rows.append(
+            (
+                record_id,
+                log["organization_id"],
+                log["driver_user_id"],
+                log["created_by_user_id"],
+                log["trip_run_id"],
+                log["log_date"],
+                log["cycle"],
+                json.dumps(log["values"], separators=(",", ":"), ensure_ascii=True),
+                json.dumps(log["recap"], separators=(",", ":"), ensure_ascii=True),
+                json.dumps(log["compliance"], separators=(",", ":"), ensure_ascii=True),
+                json.dumps(log["timeline_events"], separators=(",", ":"), ensure_ascii=True),
+                log["svg_path"],
+                log["pdf_path"],
+                created_at,
+            )
+        )
+
+    if not rows:
+        return records
 
     with connect(db_path) as conn:
-        conn.execute(
+        conn.executemany(
             """
             INSERT INTO daily_logs (
                 id,
@@ -823,37 +1006,11 @@ def create_daily_log(
             )
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """,
-            (
-                record_id,
-                organization_id,
-                driver_user_id,
-                created_by_user_id,
-                trip_run_id,
-                log_date,
-                cycle,
-                json.dumps(values, separators=(",", ":"), ensure_ascii=True),
-                json.dumps(recap, separators=(",", ":"), ensure_ascii=True),
-                json.dumps(compliance, separators=(",", ":"), ensure_ascii=True),
-                json.dumps(timeline_events, separators=(",", ":"), ensure_ascii=True),
-                svg_path,
-                pdf_path,
-                created_at,
-            ),
+            rows,
         )
         conn.commit()
 
-    return {
-        "id": record_id,
-        "organization_id": organization_id,
-        "driver_user_id": driver_user_id,
-        "created_by_user_id": created_by_user_id,
-        "trip_run_id": trip_run_id,
-        "log_date": log_date,
-        "cycle": cycle,
-        "svg_path": svg_path,
-        "pdf_path": pdf_path,
-        "created_at": created_at,
-    }
+    return records
 
 
 def _parse_json_column(row: sqlite3.Row, key: str) -> Any:
@@ -913,32 +1070,30 @@ def list_daily_logs(
     params.append(max(1, min(limit, 200)))
 
     with connect(db_path) as conn:
-        rows = conn.execute(query, tuple(params)).fetchall()
-
-    items: list[dict[str, Any]] = []
-    for row in rows:
-        compliance = _parse_json_column(row, "compliance_json") or {}
-        items.append(
-            {
-                "id": str(row["id"]),
-                "organization_id": str(row["organization_id"]),
-                "driver_user_id": str(row["driver_user_id"]),
-                "driver_name": str(row["driver_name"]),
-                "driver_email": str(row["driver_email"]),
-                "created_by_user_id": str(row["created_by_user_id"]),
-                "created_by_name": str(row["created_by_name"]),
-                "trip_run_id": str(row["trip_run_id"]) if row["trip_run_id"] is not None else None,
-                "log_date": str(row["log_date"]),
-                "cycle": str(row["cycle"]),
-                "is_legal_today": bool(compliance.get("is_legal_today", True)),
-                "is_legal_tomorrow": bool(compliance.get("is_legal_tomorrow", True)),
-                "available_hours_tomorrow": compliance.get("available_hours_tomorrow"),
-                "svg_path": str(row["svg_path"]),
-                "pdf_path": str(row["pdf_path"]),
-                "created_at": str(row["created_at"]),
-            }
-        )
-    return items
+        items: list[dict[str, Any]] = []
+        for row in conn.execute(query, tuple(params)):
+            compliance = _parse_json_column(row, "compliance_json") or {}
+            items.append(
+                {
+                    "id": str(row["id"]),
+                    "organization_id": str(row["organization_id"]),
+                    "driver_user_id": str(row["driver_user_id"]),
+                    "driver_name": str(row["driver_name"]),
+                    "driver_email": str(row["driver_email"]),
+                    "created_by_user_id": str(row["created_by_user_id"]),
+                    "created_by_name": str(row["created_by_name"]),
+                    "trip_run_id": str(row["trip_run_id"]) if row["trip_run_id"] is not None else None,
+                    "log_date": str(row["log_date"]),
+                    "cycle": str(row["cycle"]),
+                    "is_legal_today": bool(compliance.get("is_legal_today", True)),
+                    "is_legal_tomorrow": bool(compliance.get("is_legal_tomorrow", True)),
+                    "available_hours_tomorrow": compliance.get("available_hours_tomorrow"),
+                    "svg_path": str(row["svg_path"]),
+                    "pdf_path": str(row["pdf_path"]),
+                    "created_at": str(row["created_at"]),
+                }
+            )
+        return items
 
 
 def summarize_trip_run_logs(
@@ -1044,3 +1199,26 @@ def get_daily_log(db_path: Path, record_id: str) -> dict[str, Any] | None:
         "pdf_path": str(row["pdf_path"]),
         "created_at": str(row["created_at"]),
     }
+
+
+def get_daily_log_files(db_path: Path, record_id: str) -> dict[str, str] | None:
+    with connect(db_path) as conn:
+        row = conn.execute(
+            """
+            SELECT id, organization_id, driver_user_id, svg_path, pdf_path
+            FROM daily_logs
+            WHERE id = ?
+            """,
+            (record_id,),
+        ).fetchone()
+
+    if row is None:
+        return None
+
+    return {
+        "id": str(row["id"]),
+        "organization_id": str(row["organization_id"]),
+        "driver_user_id": str(row["driver_user_id"]),
+        "svg_path": str(row["svg_path"]),
+        "pdf_path": str(row["pdf_path"]),
+    }
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from dataclasses import asdict
 import sys
 import unittest
 from pathlib import Path
@@ -96,6 +97,21 @@ class HOSComplianceTests(unittest.TestCase):
         self.assertFalse(result.is_legal_tomorrow)
         self.assertGreater(len(result.violations), 0)
 
+    def test_result_to_dict_matches_asdict(self) -> None:
+        result = apply_hos_compliance(
+            {"driving-hours": "14", "on-duty-hours": "4"},
+            HOSRecapInput(cycle=HOSCycle.CYCLE_70, previous_on_duty_hours=(12,) * 8),
+            self.available_ids,
+        )
+
+        payload = result.to_dict()
+        self.assertEqual(asdict(result), payload)
+
+        payload["violations"].append("mutated")
+        payload["computed_values"]["total-hours"] = "mutated"
+        self.assertNotIn("mutated", result.violations)
+        self.assertNotEqual("mutated", result.computed_values["total-hours"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -4,21 +4,27 @@ import sys
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
 BACKEND_DIR = Path(__file__).resolve().parents[1]
 if str(BACKEND_DIR) not in sys.path:
     sys.path.insert(0, str(BACKEND_DIR))
 
+import persistence  # type: ignore
 from persistence import (  # type: ignore
     create_bootstrap_admin,
     create_daily_log,
+    create_daily_logs,
+    create_driver_account,
     create_user_with_organization,
     create_trip_run,
     create_session,
     create_user,
     get_driver_profile,
     get_daily_log,
+    get_daily_log_files,
     get_trip_run,
+    get_user_and_profile_by_session_token,
     get_user_by_email,
     get_user_by_session_token,
     hash_password,
@@ -33,12 +39,29 @@ from persistence import (  # type: ignore
 
 
 class PersistenceTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        with mock.patch.object(persistence, "PBKDF2_ITERATIONS", 1_000):
+            cls.password_hash = hash_password("Password123!")
+
     def with_db(self) -> tuple[Path, tempfile.TemporaryDirectory[str]]:
         tmp = tempfile.TemporaryDirectory()
         db_path = Path(tmp.name) / "app.db"
         init_db(db_path)
         return db_path, tmp
 
+    def test_init_db_recreates_removed_data_directory(self) -> None:
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        db_path = Path(temp_dir.name) / "data" / "app.db"
+
+        init_db(db_path)
+        db_path.unlink()
+        db_path.parent.rmdir()
+        init_db(db_path)
+
+        self.assertTrue(db_path.exists())
+
     def test_bootstrap_hash_and_session(self) -> None:
         db_path, temp_dir = self.with_db()
         self.addCleanup(temp_dir.cleanup)
@@ -48,7 +71,7 @@ class PersistenceTests(unittest.TestCase):
             organization_name="Acme Logistics",
             full_name="Admin User",
             email="admin@example.com",
-            password_hash_value=hash_password("Password123!"),
+            password_hash_value=self.password_hash,
         )
 
         loaded_admin, password_hash_value = get_user_by_email(db_path, "admin@example.com")
@@ -62,6 +85,7 @@ class PersistenceTests(unittest.TestCase):
         session_user = get_user_by_session_token(db_path, session.token)
         self.assertIsNotNone(session_user)
         self.assertEqual(session_user.id, admin.id)
+        self.assertEqual((session_user, None), get_user_and_profile_by_session_token(db_path, session.token))
 
     def test_create_user_and_filter_by_role(self) -> None:
         db_path, temp_dir = self.with_db()
@@ -72,7 +96,7 @@ class PersistenceTests(unittest.TestCase):
             organization_name="Acme Logistics",
             full_name="Admin User",
             email="admin@example.com",
-            password_hash_value=hash_password("Password123!"),
+            password_hash_value=self.password_hash,
         )
         driver = create_user(
             db_path=db_path,
@@ -80,7 +104,7 @@ class PersistenceTests(unittest.TestCase):
             full_name="Driver One",
             email="driver1@example.com",
             role="driver",
-            password_hash_value=hash_password("Password123!"),
+            password_hash_value=self.password_hash,
         )
 
         drivers = list_users(db_path, admin.organization_id, role="driver")
@@ -98,7 +122,7 @@ class PersistenceTests(unittest.TestCase):
             full_name="Driver One",
             email="driver1@example.com",
             role="driver",
-            password_hash_value=hash_password("Password123!"),
+            password_hash_value=self.password_hash,
         )
 
         profile = upsert_driver_profile(
@@ -119,6 +143,30 @@ class PersistenceTests(unittest.TestCase):
         self.assertEqual("Northwind Transport", loaded.carrier_name)
         self.assertTrue(loaded.is_onboarding_complete)
 
+        session = create_session(db_path, driver.id)
+        session_user, session_profile = get_user_and_profile_by_session_token(db_path, session.token)
+        self.assertEqual(driver.id, session_user.id)
+        self.assertEqual(loaded, session_profile)
+
+    def test_create_driver_account_with_empty_profile(self) -> None:
+        db_path, temp_dir = self.with_db()
+        self.addCleanup(temp_dir.cleanup)
+
+        driver, profile = create_driver_account(
+            db_path=db_path,
+            organization_name="Northwind Transport",
+            full_name=" Driver One ",
+            email="Driver1@Example.com",
+            password_hash_value=self.password_hash,
+        )
+
+        self.assertEqual((driver, self.password_hash), get_user_by_email(db_path, "driver1@example.com"))
+        self.assertEqual("Driver One", driver.full_name)
+        self.assertEqual("driver", driver.role)
+        self.assertEqual(profile, get_driver_profile(db_path, driver.id))
+        self.assertEqual("70", profile.cycle_rule)
+        self.assertFalse(profile.is_onboarding_complete)
+
     def test_create_and_retrieve_daily_log(self) -> None:
         db_path, temp_dir = self.with_db()
         self.addCleanup(temp_dir.cleanup)
@@ -128,7 +176,7 @@ class PersistenceTests(unittest.TestCase):
             organization_name="Acme Logistics",
             full_name="Admin User",
             email="admin@example.com",
-            password_hash_value=hash_password("Password123!"),
+            password_hash_value=self.password_hash,
         )
         driver = create_user(
             db_path=db_path,
@@ -136,7 +184,7 @@ class PersistenceTests(unittest.TestCase):
             full_name="Driver One",
             email="driver1@example.com",
             role="driver",
-            password_hash_value=hash_password("Password123!"),
+            password_hash_value=self.password_hash,
         )
 
         created = create_daily_log(
@@ -165,6 +213,51 @@ class PersistenceTests(unittest.TestCase):
         self.assertEqual("2026-02-10", fetched["log_date"])
         self.assertEqual("PHOENIX, AZ", fetched["values"]["from"])
 
+        files = get_daily_log_files(db_path, created["id"])
+        self.assertIsNotNone(files)
+        self.assertEqual(driver.id, files["driver_user_id"])
+        self.assertEqual("/tmp/a.pdf", files["pdf_path"])
+
+    def test_create_daily_logs_in_batch(self) -> None:
+        db_path, temp_dir = self.with_db()
+        self.addCleanup(temp_dir.cleanup)
+
+        driver = create_user_with_organization(
+            db_path=db_path,
+            organization_name="Northwind Transport",
+            full_name="Driver One",
+            email="driver1@example.com",
+            role="driver",
+            password_hash_value=self.password_hash,
+        )
+
+        created = create_daily_logs(
+            db_path,
+            [
+                {
+                    "id": f"log-{day}",
+                    "organization_id": driver.organization_id,
+                    "driver_user_id": driver.id,
+                    "created_by_user_id": driver.id,
+                    "trip_run_id": None,
+                    "log_date": f"2026-02-{day}",
+                    "cycle": "70",
+                    "values": {"from": "PHOENIX, AZ"},
+                    "recap": {},
+                    "compliance": {"is_legal_today": True},
+                    "timeline_events": [],
+                    "svg_path": f"/tmp/{day}.svg",
+                    "pdf_path": f"/tmp/{day}.pdf",
+                }
+                for day in ("10", "11", "12")
+            ],
+        )
+        self.assertEqual(["log-10", "log-11", "log-12"], [record["id"] for record in created])
+
+        listed = list_daily_logs(db_path=db_path, organization_id=driver.organization_id)
+        self.assertEqual(["2026-02-12", "2026-02-11", "2026-02-10"], [item["log_date"] for item in listed])
+        self.assertEqual("/tmp/11.pdf", get_daily_log(db_path, "log-11")["pdf_path"])
+
     def test_trip_run_links_daily_logs(self) -> None:
         db_path, temp_dir = self.with_db()
         self.addCleanup(temp_dir.cleanup)
@@ -174,7 +267,7 @@ class PersistenceTests(unittest.TestCase):
             organization_name="Acme Logistics",
             full_name="Admin User",
             email="admin@example.com",
-            password_hash_value=hash_password("Password123!"),
+            password_hash_value=self.password_hash,
         )
         driver = create_user(
             db_path=db_path,
@@ -182,7 +275,7 @@ class PersistenceTests(unittest.TestCase):
             full_name="Driver One",
             email="driver1@example.com",
             role="driver",
-            password_hash_value=hash_password("Password123!"),
+            password_hash_value=self.password_hash,
         )
 
         plan = {
@@ -266,7 +359,7 @@ class PersistenceTests(unittest.TestCase):
             organization_name="Acme Logistics",
             full_name="Admin User",
             email="admin@example.com",
-            password_hash_value=hash_password("Password123!"),
+            password_hash_value=self.password_hash,
         )
         driver = create_user(
             db_path=db_path,
@@ -274,7 +367,7 @@ class PersistenceTests(unittest.TestCase):
             full_name="Driver One",
             email="driver1@example.com",
             role="driver",
-            password_hash_value=hash_password("Password123!"),
+            password_hash_value=self.password_hash,
         )
 
         trip = create_trip_run(
@@ -292,42 +385,39 @@ class PersistenceTests(unittest.TestCase):
             plan={"days_count": 2},
         )
 
-        create_daily_log(
-            db_path=db_path,
-            organization_id=admin.organization_id,
-            driver_user_id=driver.id,
-            created_by_user_id=admin.id,
-            trip_run_id=trip["id"],
-            log_date="2026-02-10",
-            cycle="70",
-            values={},
-            recap={},
-            compliance={"is_legal_today": True, "is_legal_tomorrow": True},
-            timeline_events=[],
-            svg_path="/tmp/a.svg",
-            pdf_path="/tmp/a.pdf",
-        )
-        create_daily_log(
-            db_path=db_path,
-            organization_id=admin.organization_id,
-            driver_user_id=driver.id,
-            created_by_user_id=admin.id,
-            trip_run_id=trip["id"],
-            log_date="2026-02-11",
-            cycle="70",
-            values={},
-            recap={},
-            compliance={"is_legal_today": False, "is_legal_tomorrow": True},
-            timeline_events=[],
-            svg_path="/tmp/b.svg",
-            pdf_path="/tmp/b.pdf",
+        create_daily_logs(
+            db_path,
+            [
+                {
+                    "organization_id": admin.organization_id,
+                    "driver_user_id": driver.id,
+                    "created_by_user_id": admin.id,
+                    "trip_run_id": trip["id"],
+                    "log_date": log_date,
+                    "cycle": "70",
+                    "values": {},
+                    "recap": {},
+                    "compliance": {"is_legal_today": is_legal_today, "is_legal_tomorrow": True},
+                    "timeline_events": [],
+                    "svg_path": f"/tmp/{log_date}.svg",
+                    "pdf_path": f"/tmp/{log_date}.pdf",
+                }
+                for log_date, is_legal_today in (
+                    ("2026-02-10", True),
+                    ("2026-02-11", False),
+                    ("2026-02-12", 0),
+                    ("2026-02-13", ""),
+                    ("2026-02-14", None),
+                    ("2026-02-15", "yes"),
+                )
+            ],
         )
 
         summary = summarize_trip_run_logs(db_path, admin.organization_id, [trip["id"]])
         self.assertIn(trip["id"], summary)
-        self.assertEqual(2, summary[trip["id"]]["generated_sheet_count"])
+        self.assertEqual(6, summary[trip["id"]]["generated_sheet_count"])
         self.assertFalse(summary[trip["id"]]["all_logs_legal"])
-        self.assertEqual(1, summary[trip["id"]]["non_compliant_count"])
+        self.assertEqual(4, summary[trip["id"]]["non_compliant_count"])
 
 
 if __name__ == "__main__":
@@ -1,15 +1,20 @@
 from __future__ import annotations
 
+from dataclasses import asdict
 from datetime import date
+import io
 import sys
+import threading
 import unittest
 from pathlib import Path
+from unittest import mock
 
 BACKEND_DIR = Path(__file__).resolve().parents[1]
 if str(BACKEND_DIR) not in sys.path:
     sys.path.insert(0, str(BACKEND_DIR))
 
-from trip_planner import TripPlannerError, plan_trip
+import trip_planner  # type: ignore
+from trip_planner import LocationPoint, TripPlannerError, plan_trip
 
 
 class TripPlannerTests(unittest.TestCase):
@@ -47,6 +52,191 @@ class TripPlannerTests(unittest.TestCase):
                 start_date=date(2026, 2, 10),
             )
 
+    def test_record_to_dict_matches_asdict(self) -> None:
+        with mock.patch.object(trip_planner, "_http_json", side_effect=OSError("offline")):
+            result = plan_trip(
+                current_location="33.4484,-112.0740",
+                pickup_location="35.1983,-111.6513",
+                dropoff_location="32.7767,-96.7970",
+                current_cycle_used_hours=8.0,
+                cycle="70",
+                start_date=date(2026, 2, 10),
+            )
+        legs, _, _, _ = trip_planner._fallback_route(
+            [LocationPoint("A", 33.4484, -112.0740), LocationPoint("B", 35.1983, -111.6513)]
+        )
+
+        records = [LocationPoint("Phoenix", 33.4484, -112.074), *legs, *result.daily_logs]
+        for record in records:
+            self.assertEqual(asdict(record), record.to_dict())
+
+        day = result.daily_logs[0]
+        payload = day.to_dict()
+        payload["notes"].append("mutated")
+        payload["timeline_events"][0]["duty"] = "mutated"
+        self.assertNotIn("mutated", day.notes)
+        self.assertNotEqual("mutated", day.timeline_events[0]["duty"])
+
+
+class OSRMRouteCacheTests(unittest.TestCase):
+    points = [
+        LocationPoint("Phoenix", 33.4484, -112.0740),
+        LocationPoint("Flagstaff", 35.1983, -111.6513),
+        LocationPoint("Dallas", 32.7767, -96.7970),
+    ]
+    response = {
+        "routes": [
+            {
+                "distance": 1609340.0,
+                "duration": 72000.0,
+                "geometry": {"coordinates": [[-112.074, 33.4484], [-96.797, 32.7767]]},
+                "legs": [
+                    {"distance": 321868.0, "duration": 14400.0, "steps": []},
+                    {"distance": 1287472.0, "duration": 57600.0, "steps": []},
+                ],
+            }
+        ]
+    }
+
+    def setUp(self) -> None:
+        trip_planner._ROUTE_CACHE.cache_clear()
+        self.addCleanup(trip_planner._ROUTE_CACHE.cache_clear)
+
+    def test_repeat_route_is_served_from_cache(self) -> None:
+        with mock.patch.object(trip_planner, "_http_json", return_value=self.response) as http_json:
+            first = trip_planner._route_via_osrm(self.points)
+            trip_planner._fetch_osrm_route(
+                ";".join(f"{point.lon:.6f},{point.lat:.6f}" for point in self.points)
+            )["legs"].clear()
+            second = trip_planner._route_via_osrm(self.points)
+
+        self.assertEqual(1, http_json.call_count)
+        self.assertEqual(first, second)
+        self.assertEqual(1000.0, round(second[2], 1))
+
+    def test_failed_route_is_not_cached(self) -> None:
+        with mock.patch.object(trip_planner, "_http_json", side_effect=OSError("offline")):
+            fallback = trip_planner._route_via_osrm(self.points)
+        self.assertEqual(["Drive from Phoenix to Flagstaff."], fallback[0][0].instructions)
+
+        with mock.patch.object(trip_planner, "_http_json", return_value=self.response) as http_json:
+            routed = trip_planner._route_via_osrm(self.points)
+
+        self.assertEqual(1, http_json.call_count)
+        self.assertEqual(1000.0, round(routed[2], 1))
+
+    def test_route_cache_expires(self) -> None:
+        with mock.patch.object(trip_planner, "_http_json", return_value=self.response) as http_json:
+            with mock.patch.object(trip_planner.time, "monotonic", return_value=1000.0):
+                trip_planner._route_via_osrm(self.points)
+            expired = 1000.0 + trip_planner.ROUTE_CACHE_TTL_SECONDS
+            with mock.patch.object(trip_planner.time, "monotonic", return_value=expired):
+                trip_planner._route_via_osrm(self.points)
+
+        self.assertEqual(2, http_json.call_count)
+
+    def test_cache_is_safe_across_threads(self) -> None:
+        cache = trip_planner._TTLCache(maxsize=4, ttl_seconds=0.0001)
+        errors: list[Exception] = []
+
+        def worker() -> None:
+            try:
+                for index in range(2000):
+                    cache.set(str(index % 6), {"index": index})
+                    cache.get(str((index + 1) % 6))
+            except Exception as exc:  # pragma: no cover - only on regression
+                errors.append(exc)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual([], errors)
+
+
+class _FakeResponse(io.BytesIO):
+    def __init__(self, body: bytes, content_length: int | None = None) -> None:
+        super().__init__(body)
+        self.headers = {} if content_length is None else {"Content-Length": str(content_length)}
+
+
+class HTTPJSONSizeCapTests(unittest.TestCase):
+    url = "https://router.project-osrm.org/route/v1/driving/test"
+
+    def test_normal_body_is_parsed(self) -> None:
+        body = b'{"routes": []}'
+        with mock.patch.object(trip_planner, "urlopen", return_value=_FakeResponse(body, len(body))):
+            self.assertEqual({"routes": []}, trip_planner._http_json(self.url))
+
+    def test_oversize_content_length_is_rejected(self) -> None:
+        response = _FakeResponse(b"{}", trip_planner.MAX_RESPONSE_BYTES + 1)
+        with mock.patch.object(trip_planner, "urlopen", return_value=response):
+            with mock.patch.object(response, "read", wraps=response.read) as read:
+                with self.assertRaises(TripPlannerError):
+                    trip_planner._http_json(self.url)
+        read.assert_not_called()
+
+    def test_unsized_body_over_cap_is_rejected(self) -> None:
+        with mock.patch.object(trip_planner, "MAX_RESPONSE_BYTES", 8):
+            with mock.patch.object(trip_planner, "urlopen", return_value=_FakeResponse(b'{"routes": []}')):
+                with self.assertRaises(TripPlannerError):
+                    trip_planner._http_json(self.url)
+
+    def test_route_falls_back_when_cap_fires(self) -> None:
+        trip_planner._ROUTE_CACHE.cache_clear()
+        self.addCleanup(trip_planner._ROUTE_CACHE.cache_clear)
+        points = [LocationPoint("A", 33.4484, -112.0740), LocationPoint("B", 35.1983, -111.6513)]
+        response = _FakeResponse(b"{}", trip_planner.MAX_RESPONSE_BYTES + 1)
+
+        with mock.patch.object(trip_planner, "urlopen", return_value=response):
+            legs, geometry, _, _ = trip_planner._route_via_osrm(points)
+
+        self.assertEqual(["Drive from A to B."], legs[0].instructions)
+        self.assertEqual([[33.4484, -112.074], [35.1983, -111.6513]], geometry)
+
+
+class GeocodeCacheTests(unittest.TestCase):
+    match = [{"lat": "32.7767", "lon": "-96.7970", "display_name": "Dallas, Texas, United States"}]
+
+    def setUp(self) -> None:
+        trip_planner._GEOCODE_CACHE.cache_clear()
+        self.addCleanup(trip_planner._GEOCODE_CACHE.cache_clear)
+
+    def test_repeat_query_hits_network_once(self) -> None:
+        with mock.patch.object(trip_planner, "_http_json", return_value=self.match) as http_json:
+            first = trip_planner._geocode_location("Dallas, TX")
+            second = trip_planner._geocode_location("  dallas,   tx ")
+
+        self.assertEqual(1, http_json.call_count)
+        self.assertEqual(first, second)
+
+    def test_empty_result_expires_after_miss_ttl(self) -> None:
+        with mock.patch.object(trip_planner, "_http_json", return_value=[]) as http_json:
+            with mock.patch.object(trip_planner.time, "monotonic", return_value=1000.0):
+                with self.assertRaises(TripPlannerError):
+                    trip_planner._geocode_location("Dalas, TX")
+                with self.assertRaises(TripPlannerError):
+                    trip_planner._geocode_location("Dalas, TX")
+        self.assertEqual(1, http_json.call_count)
+
+        expired = 1000.0 + trip_planner.GEOCODE_MISS_CACHE_TTL_SECONDS
+        with mock.patch.object(trip_planner, "_http_json", return_value=self.match) as http_json:
+            with mock.patch.object(trip_planner.time, "monotonic", return_value=expired):
+                point = trip_planner._geocode_location("Dalas, TX")
+
+        self.assertEqual(1, http_json.call_count)
+        self.assertEqual(32.7767, point.lat)
+
+    def test_cache_clear_forces_a_new_lookup(self) -> None:
+        with mock.patch.object(trip_planner, "_http_json", return_value=self.match) as http_json:
+            trip_planner._geocode_location("Dallas, TX")
+            trip_planner._GEOCODE_CACHE.cache_clear()
+            trip_planner._geocode_location("Dallas, TX")
+
+        self.assertEqual(2, http_json.call_count)
+
 
 if __name__ == "__main__":
     unittest.main()
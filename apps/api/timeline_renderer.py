@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 import re
 from typing import Sequence
 import xml.etree.ElementTree as ET
@@ -68,6 +69,15 @@ def _minutes(point: TimelinePoint) -> int:
 
 def detect_template_scale(template_path: Path) -> float:
     """Scale canonical constants to template user units using width/viewBox ratio."""
+    try:
+        mtime_ns = template_path.stat().st_mtime_ns
+    except OSError:
+        return 1.0
+    return _detect_template_scale(template_path, mtime_ns)
+
+
+@lru_cache(maxsize=8)
+def _detect_template_scale(template_path: Path, mtime_ns: int) -> float:
     try:
         root = ET.parse(template_path).getroot()
     except Exception:
@@ -140,13 +150,19 @@ def _validate_point(point: TimelinePoint, point_name: str) -> None:
 
 def normalize_events(events: Sequence[TimelineEvent]) -> list[TimelineEvent]:
     normalized: list[TimelineEvent] = []
+    is_sorted = True
+    previous_start = -1
 
     for index, event in enumerate(events):
         _validate_point(event.start, f"events[{index}].start")
+        start_minutes = _minutes(event.start)
+        if start_minutes < previous_start:
+            is_sorted = False
+        previous_start = start_minutes
 
         if event.end is not None:
             _validate_point(event.end, f"events[{index}].end")
-            if _minutes(event.end) <= _minutes(event.start):
+            if _minutes(event.end) <= start_minutes:
                 raise TimelineRenderError(
                     f"events[{index}] has invalid duration: end must be after start"
                 )
@@ -154,7 +170,8 @@ def normalize_events(events: Sequence[TimelineEvent]) -> list[TimelineEvent]:
         normalized.append(event)
 
     # Stable sort by start time only. Keep caller order for same-time transitions.
-    normalized.sort(key=lambda e: _minutes(e.start))
+    if not is_sorted:
+        normalized.sort(key=lambda e: _minutes(e.start))
     return normalized
 
 
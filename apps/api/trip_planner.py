@@ -1,10 +1,14 @@
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+from collections import OrderedDict
+from copy import deepcopy
+from dataclasses import dataclass
 from datetime import date, timedelta
 import json
 import math
 import re
+import threading
+import time
 from typing import Any, Sequence
 from urllib.error import HTTPError, URLError
 from urllib.parse import quote_plus
@@ -23,6 +27,22 @@ PRETRIP_HOURS = 0.5
 MAX_DRIVING_HOURS_PER_DAY = 11.0
 MAX_ON_DUTY_HOURS_PER_DAY = 14.0
 DEFAULT_AVG_SPEED_MPH = 50.0
+RESTART_HOURS = 34.0
+
+MAX_DRIVING_MINUTES_PER_DAY = int(round(MAX_DRIVING_HOURS_PER_DAY * MINUTES_PER_HOUR))
+MAX_ON_DUTY_MINUTES_PER_DAY = int(round(MAX_ON_DUTY_HOURS_PER_DAY * MINUTES_PER_HOUR))
+PRETRIP_MINUTES = int(round(PRETRIP_HOURS * MINUTES_PER_HOUR))
+RESTART_MINUTES = int(round(RESTART_HOURS * MINUTES_PER_HOUR))
+
+GEOMETRY_DECIMALS = 5
+MAX_RESPONSE_BYTES = 8 * 1024 * 1024
+HTTP_HEADERS = {
+    "User-Agent": "eld-adv-trip-planner/1.0",
+    "Accept": "application/json",
+}
+ROUTE_CACHE_TTL_SECONDS = 3600.0
+GEOCODE_CACHE_TTL_SECONDS = 30 * 24 * 3600.0
+GEOCODE_MISS_CACHE_TTL_SECONDS = 3600.0
 
 COORDINATE_INPUT = re.compile(
     r"^\s*(?P<lat>[-+]?\d{1,2}(?:\.\d+)?)\s*,\s*(?P<lon>[-+]?\d{1,3}(?:\.\d+)?)\s*$"
@@ -39,6 +59,9 @@ class LocationPoint:
     lat: float
     lon: float
 
+    def to_dict(self) -> dict[str, Any]:
+        return {"label": self.label, "lat": self.lat, "lon": self.lon}
+
 
 @dataclass(frozen=True)
 class RouteLeg:
@@ -49,6 +72,16 @@ class RouteLeg:
     duration_hours: float
     instructions: list[str]
 
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "index": self.index,
+            "from_location": self.from_location,
+            "to_location": self.to_location,
+            "distance_miles": self.distance_miles,
+            "duration_hours": self.duration_hours,
+            "instructions": list(self.instructions),
+        }
+
 
 @dataclass(frozen=True)
 class PlannedDay:
@@ -63,6 +96,20 @@ class PlannedDay:
     timeline_events: list[dict[str, Any]]
     notes: list[str]
 
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "index": self.index,
+            "log_date": self.log_date,
+            "miles_driven": self.miles_driven,
+            "off_duty_hours": self.off_duty_hours,
+            "sleeper_berth_hours": self.sleeper_berth_hours,
+            "driving_hours": self.driving_hours,
+            "on_duty_hours": self.on_duty_hours,
+            "total_hours": self.total_hours,
+            "timeline_events": deepcopy(self.timeline_events),
+            "notes": list(self.notes),
+        }
+
 
 @dataclass(frozen=True)
 class TripPlanResult:
@@ -84,7 +131,7 @@ class TripPlanResult:
             "locations": self.locations,
             "route": self.route,
             "stops": self.stops,
-            "daily_logs": [asdict(day) for day in self.daily_logs],
+            "daily_logs": [day.to_dict() for day in self.daily_logs],
             "days_count": len(self.daily_logs),
         }
 
@@ -98,6 +145,43 @@ class _Task:
     location: str
 
 
+class _TTLCache:
+    def __init__(self, maxsize: int, ttl_seconds: float) -> None:
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                self._entries.pop(key, None)
+                return False, None
+            self._entries.move_to_end(key)
+        return True, deepcopy(value)
+
+    def set(self, key: str, value: Any, ttl_seconds: float | None = None) -> None:
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        entry = (time.monotonic() + ttl, deepcopy(value))
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def cache_clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_ROUTE_CACHE = _TTLCache(maxsize=128, ttl_seconds=ROUTE_CACHE_TTL_SECONDS)
+_GEOCODE_CACHE = _TTLCache(maxsize=256, ttl_seconds=GEOCODE_CACHE_TTL_SECONDS)
+
+
 def _round_hours(minutes: int) -> float:
     return round(minutes / MINUTES_PER_HOUR, 2)
 
@@ -127,16 +211,15 @@ def _haversine_miles(a_lat: float, a_lon: float, b_lat: float, b_lon: float) ->
 
 
 def _http_json(url: str, timeout_seconds: int = 12) -> Any:
-    request = Request(
-        url=url,
-        headers={
-            "User-Agent": "eld-adv-trip-planner/1.0",
-            "Accept": "application/json",
-        },
-    )
+    request = Request(url=url, headers=HTTP_HEADERS)
     with urlopen(request, timeout=timeout_seconds) as response:  # nosec B310 - controlled URLs.
-        payload = response.read().decode("utf-8")
-    return json.loads(payload)
+        content_length = response.headers.get("Content-Length")
+        if content_length and content_length.isdigit() and int(content_length) > MAX_RESPONSE_BYTES:
+            raise TripPlannerError("Map service response is too large.")
+        payload = response.read(MAX_RESPONSE_BYTES + 1)
+    if len(payload) > MAX_RESPONSE_BYTES:
+        raise TripPlannerError("Map service response is too large.")
+    return json.loads(payload.decode("utf-8"))
 
 
 def _parse_coordinate_input(raw_location: str) -> LocationPoint | None:
@@ -152,16 +235,27 @@ def _parse_coordinate_input(raw_location: str) -> LocationPoint | None:
     return LocationPoint(label=raw_location.strip(), lat=lat, lon=lon)
 
 
+def _fetch_geocode_match(query: str) -> dict[str, Any] | None:
+    hit, match = _GEOCODE_CACHE.get(query)
+    if hit:
+        return match
+
+    url = f"https://nominatim.openstreetmap.org/search?format=jsonv2&limit=1&q={quote_plus(query)}"
+    data = _http_json(url)
+    if not isinstance(data, list) or len(data) == 0 or not isinstance(data[0], dict):
+        _GEOCODE_CACHE.set(query, None, ttl_seconds=GEOCODE_MISS_CACHE_TTL_SECONDS)
+        return None
+    _GEOCODE_CACHE.set(query, data[0])
+    return data[0]
+
+
 def _geocode_location(raw_location: str) -> LocationPoint:
     parsed = _parse_coordinate_input(raw_location)
     if parsed is not None:
         return parsed
 
-    query = quote_plus(raw_location.strip())
-    url = f"https://nominatim.openstreetmap.org/search?format=jsonv2&limit=1&q={query}"
-
     try:
-        data = _http_json(url)
+        match = _fetch_geocode_match(" ".join(raw_location.split()).casefold())
     except HTTPError as exc:
         raise TripPlannerError(
             f"Geocoding failed for '{raw_location}' with HTTP {exc.code}. "
@@ -175,10 +269,9 @@ def _geocode_location(raw_location: str) -> LocationPoint:
     except Exception as exc:
         raise TripPlannerError(f"Failed to geocode '{raw_location}'.") from exc
 
-    if not isinstance(data, list) or len(data) == 0:
+    if match is None:
         raise TripPlannerError(f"No map match found for '{raw_location}'.")
 
-    match = data[0]
     try:
         lat = float(match["lat"])
         lon = float(match["lon"])
@@ -232,29 +325,39 @@ def _fallback_route(points: Sequence[LocationPoint]) -> tuple[list[RouteLeg], li
     return legs, geometry, total_distance_miles, total_duration_hours
 
 
-def _route_via_osrm(points: Sequence[LocationPoint]) -> tuple[list[RouteLeg], list[list[float]], float, float]:
-    if len(points) < 2:
-        raise TripPlannerError("At least two locations are required for routing.")
+def _fetch_osrm_route(coordinates: str) -> dict[str, Any]:
+    hit, route = _ROUTE_CACHE.get(coordinates)
+    if hit:
+        return route
 
-    coordinates = ";".join([f"{point.lon:.6f},{point.lat:.6f}" for point in points])
     url = (
         "https://router.project-osrm.org/route/v1/driving/"
         f"{coordinates}?overview=full&geometries=geojson&steps=true"
     )
+    data = _http_json(url)
+    routes = data.get("routes") if isinstance(data, dict) else None
+    if not isinstance(routes, list) or len(routes) == 0 or not isinstance(routes[0], dict):
+        raise TripPlannerError("No route returned by OSRM.")
+    _ROUTE_CACHE.set(coordinates, routes[0])
+    return routes[0]
 
-    try:
-        data = _http_json(url)
-        routes = data.get("routes") if isinstance(data, dict) else None
-        if not isinstance(routes, list) or len(routes) == 0:
-            raise TripPlannerError("No route returned by OSRM.")
 
-        route = routes[0]
+def _route_via_osrm(points: Sequence[LocationPoint]) -> tuple[list[RouteLeg], list[list[float]], float, float]:
+    if len(points) < 2:
+        raise TripPlannerError("At least two locations are required for routing.")
+
+    coordinates = ";".join([f"{point.lon:.6f},{point.lat:.6f}" for point in points])
+
+    try:
+        route = _fetch_osrm_route(coordinates)
         route_geometry = route.get("geometry", {}).get("coordinates", [])
         geometry = []
         for raw in route_geometry:
             if not isinstance(raw, list) or len(raw) < 2:
                 continue
-            geometry.append([float(raw[1]), float(raw[0])])  # lat, lon
+            lat = round(float(raw[1]), GEOMETRY_DECIMALS)
+            lon = round(float(raw[0]), GEOMETRY_DECIMALS)
+            geometry.append([lat, lon])
 
         legs_raw = route.get("legs", [])
         legs: list[RouteLeg] = []
@@ -298,12 +401,15 @@ def _expand_with_fuel_stops(initial_tasks: Sequence[_Task]) -> list[_Task]:
     expanded: list[_Task] = []
     miles_until_fuel = FUEL_INTERVAL_MILES
 
-    def remaining_drive_miles(index: int) -> float:
-        miles = 0.0
-        for future in initial_tasks[index + 1 :]:
-            if future.kind == "drive":
-                miles += future.remaining_miles
-        return miles
+    future_drive_miles = [0.0] * len(initial_tasks)
+    running_miles = 0.0
+    for index in range(len(initial_tasks) - 1, -1, -1):
+        future_drive_miles[index] = running_miles
+        if initial_tasks[index].kind == "drive":
+            running_miles += initial_tasks[index].remaining_miles
+
+    if running_miles < FUEL_INTERVAL_MILES - 0.01:
+        return list(initial_tasks)
 
     for index, task in enumerate(initial_tasks):
         if task.kind != "drive":
@@ -312,7 +418,7 @@ def _expand_with_fuel_stops(initial_tasks: Sequence[_Task]) -> list[_Task]:
 
         remaining_minutes = task.remaining_minutes
         remaining_miles = task.remaining_miles
-        future_miles = remaining_drive_miles(index)
+        future_miles = future_drive_miles[index]
 
         while remaining_minutes > 0 and remaining_miles > 0:
             miles_chunk = min(remaining_miles, miles_until_fuel)
@@ -426,18 +532,19 @@ def _build_daily_logs(
     stops: list[dict[str, Any]] = []
 
     day_index = 0
+    cycle_cap_minutes = int(round(cycle_cap_hours * MINUTES_PER_HOUR))
     remaining_cycle_minutes = max(0, int(round((cycle_cap_hours - current_cycle_used_hours) * MINUTES_PER_HOUR)))
     restart_minutes = 0
 
     while queue:
-        day_date = start_date + timedelta(days=day_index)
+        log_date = (start_date + timedelta(days=day_index)).isoformat()
 
         if remaining_cycle_minutes <= 0:
             restart_minutes += MINUTES_PER_DAY
             days.append(
                 PlannedDay(
                     index=day_index + 1,
-                    log_date=day_date.isoformat(),
+                    log_date=log_date,
                     miles_driven=0.0,
                     off_duty_hours=24.0,
                     sleeper_berth_hours=0.0,
@@ -455,18 +562,15 @@ def _build_daily_logs(
                 )
             )
 
-            if restart_minutes >= int(round(34.0 * MINUTES_PER_HOUR)):
-                remaining_cycle_minutes = int(round(cycle_cap_hours * MINUTES_PER_HOUR))
+            if restart_minutes >= RESTART_MINUTES:
+                remaining_cycle_minutes = cycle_cap_minutes
                 restart_minutes = 0
 
             day_index += 1
             continue
 
-        day_on_duty_budget = min(
-            int(round(MAX_ON_DUTY_HOURS_PER_DAY * MINUTES_PER_HOUR)),
-            remaining_cycle_minutes,
-        )
-        day_driving_budget = int(round(MAX_DRIVING_HOURS_PER_DAY * MINUTES_PER_HOUR))
+        day_on_duty_budget = min(MAX_ON_DUTY_MINUTES_PER_DAY, remaining_cycle_minutes)
+        day_driving_budget = MAX_DRIVING_MINUTES_PER_DAY
         day_blocks: list[dict[str, Any]] = []
         day_notes: list[str] = []
         day_miles = 0.0
@@ -476,7 +580,7 @@ def _build_daily_logs(
         day_cursor = 6 * MINUTES_PER_HOUR
 
         if queue:
-            pretrip_minutes = min(int(round(PRETRIP_HOURS * MINUTES_PER_HOUR)), day_on_duty_budget)
+            pretrip_minutes = min(PRETRIP_MINUTES, day_on_duty_budget)
             _append_block(day_blocks, "on", pretrip_minutes)
             day_on_duty_budget -= pretrip_minutes
             day_cursor += pretrip_minutes
@@ -523,7 +627,7 @@ def _build_daily_logs(
                             "type": _stop_type_from_note(task.note),
                             "label": task.note,
                             "location": task.location,
-                            "date": day_date.isoformat(),
+                            "date": log_date,
                             "time": f"{day_cursor // MINUTES_PER_HOUR:02d}:{day_cursor % MINUTES_PER_HOUR:02d}",
                         }
                     )
@@ -533,23 +637,24 @@ def _build_daily_logs(
             # Safety valve to prevent infinite loops from malformed tasks.
             raise TripPlannerError("Planner could not allocate remaining tasks within HOS limits.")
 
-        used_minutes = sum(int(block["minutes"]) for block in day_blocks)
-        if used_minutes < MINUTES_PER_DAY:
-            _append_block(day_blocks, "off", MINUTES_PER_DAY - used_minutes)
-
         duty_minutes = {"off": 0, "sleeper": 0, "driving": 0, "on": 0}
         for block in day_blocks:
             duty = str(block["duty"])
             if duty in duty_minutes:
                 duty_minutes[duty] += int(block["minutes"])
 
+        used_minutes = sum(duty_minutes.values())
+        if used_minutes < MINUTES_PER_DAY:
+            _append_block(day_blocks, "off", MINUTES_PER_DAY - used_minutes)
+            duty_minutes["off"] += MINUTES_PER_DAY - used_minutes
+
         on_duty_minutes = duty_minutes["driving"] + duty_minutes["on"]
         remaining_cycle_minutes = max(0, remaining_cycle_minutes - on_duty_minutes)
 
         days.append(
             PlannedDay(
                 index=day_index + 1,
-                log_date=day_date.isoformat(),
+                log_date=log_date,
                 miles_driven=round(day_miles, 2),
                 off_duty_hours=_round_hours(duty_minutes["off"]),
                 sleeper_berth_hours=_round_hours(duty_minutes["sleeper"]),
@@ -661,14 +766,14 @@ def plan_trip(
         "total_distance_miles": round(total_distance_miles, 2),
         "total_driving_hours": round(total_duration_hours, 2),
         "geometry": geometry,
-        "legs": [asdict(leg) for leg in legs],
+        "legs": [leg.to_dict() for leg in legs],
         **route_urls,
     }
 
     locations_payload = {
-        "current": asdict(current),
-        "pickup": asdict(pickup),
-        "dropoff": asdict(dropoff),
+        "current": current.to_dict(),
+        "pickup": pickup.to_dict(),
+        "dropoff": dropoff.to_dict(),
     }
 
     return TripPlanResult(